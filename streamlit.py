@@ -1,10 +1,21 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import json
+import zlib
+
+# orjson is optional; without it responses are parsed by requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set page configuration
 st.set_page_config(
@@ -16,6 +27,91 @@ st.set_page_config(
 
 # Constants
 API_BASE_URL = "http://localhost:8000"
+MAX_TREND_POINTS = 1000
+
+# Shared plotly.js options: no mode bar or hover tips to build on each redraw
+PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True, 'showTips': False}
+
+# Mock location data (in a real application, you would get actual coordinates)
+LOCATIONS = {
+    "New York": (40.7128, -74.0060),
+    "Los Angeles": (34.0522, -118.2437),
+    "Chicago": (41.8781, -87.6298),
+    "Houston": (29.7604, -95.3698),
+    "Phoenix": (33.4484, -112.0740),
+    "Philadelphia": (39.9526, -75.1652),
+    "San Antonio": (29.4241, -98.4936),
+    "San Diego": (32.7157, -117.1611),
+    "Dallas": (32.7767, -96.7970),
+    "San Jose": (37.3382, -121.8863),
+    "Austin": (30.2672, -97.7431),
+    "Jacksonville": (30.3322, -81.6557),
+    "San Francisco": (37.7749, -122.4194),
+    "Columbus": (39.9612, -82.9988),
+    "Indianapolis": (39.7684, -86.1581),
+    "Seattle": (47.6062, -122.3321),
+    "Denver": (39.7392, -104.9903),
+    "Washington": (38.9072, -77.0369),
+    "Boston": (42.3601, -71.0589),
+    "Nashville": (36.1627, -86.7816)
+}
+LOCATION_KEYS = tuple(LOCATIONS)
+LOCATION_LAT = pd.Series({name: coords[0] for name, coords in LOCATIONS.items()})
+LOCATION_LON = pd.Series({name: coords[1] for name, coords in LOCATIONS.items()})
+
+# Network table layouts
+HUB_COLUMNS = ('name', 'type', 'size', 'capacity', 'utilization')
+HUB_DTYPES = {'size': 'Int32', 'capacity': 'Int32', 'utilization': 'float32'}
+FLEET_COLUMNS = ('vehicle_id', 'type', 'capacity', 'status', 'location')
+FLEET_DTYPES = {'capacity': 'Int32'}
+
+# Table column configs, shared so every call site renders the same columns
+CUSTOMER_COLUMN_CONFIG = {
+    "CustomerID": "ID",
+    "Name": "Name",
+    "Type": "Type",
+    "Email": "Email",
+    "Phone": "Phone",
+    "Address": "Address"
+}
+PARCEL_COLUMN_CONFIG = {
+    "ParcelID": "ID",
+    "ParcelName": "Name",
+    "CustomerID": "Customer ID",
+    "Weight": st.column_config.NumberColumn("Weight (kg)", format="%.2f"),
+    "Type": "Type",
+    "ShippingMethod": "Shipping Method"
+}
+SHIPMENT_COLUMN_CONFIG = {
+    "ShipmentID": "ID",
+    "ShipmentName": "Shipment",
+    "Status": st.column_config.TextColumn("Status"),
+    "CurrentLocation": "Current Location",
+    "ShipmentDate": "Shipping Date",
+    "DeliveryDate": "Delivery Date"
+}
+HUB_COLUMN_CONFIG = {
+    "name": "Hub Name",
+    "type": "Hub Type",
+    "size": st.column_config.NumberColumn("Hub Size", format="%d"),
+    "capacity": st.column_config.NumberColumn("Capacity", format="%d"),
+    "utilization": st.column_config.ProgressColumn("Utilization", format="%d%%", min_value=0, max_value=100)
+}
+FLEET_COLUMN_CONFIG = {
+    "vehicle_id": "Vehicle ID",
+    "type": "Vehicle Type",
+    "capacity": st.column_config.NumberColumn("Capacity (kg)", format="%d"),
+    "status": "Status",
+    "location": "Current Location",
+}
+
+# Color mapping for shipment status
+COLOR_MAPPING = {
+    'Processing': 'black',
+    'In Transit': 'orange',
+    'Delivered': 'green',
+    'Delayed': 'red'
+}
 
 # Add custom CSS
 st.markdown("""
@@ -73,32 +169,105 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Helper functions
+STATUS_HTML = {
+    "delivered": '<span class="status-delivered">{}</span>',
+    "intransit": '<span class="status-intransit">{}</span>',
+    "in-transit": '<span class="status-intransit">{}</span>',
+    "processing": '<span class="status-processing">{}</span>',
+    "delayed": '<span class="status-delayed">{}</span>'
+}
+
 def format_status(status):
-    status_lower = status.lower().replace(" ", "")
-    if status_lower == "delivered":
-        return f'<span class="status-delivered">{status}</span>'
-    elif status_lower == "intransit" or status_lower == "in-transit":
-        return f'<span class="status-intransit">{status}</span>'
-    elif status_lower == "processing":
-        return f'<span class="status-processing">{status}</span>'
-    elif status_lower == "delayed":
-        return f'<span class="status-delayed">{status}</span>'
-    else:
-        return status
+    return STATUS_HTML.get(status.lower().replace(" ", ""), "{}").format(status)
+
+RECENT_SHIPMENT_CARD = """
+<div class="card">
+    <strong style="color:black;">Shipment:</strong><span style="color:navy; font-weight:bold;"> {ShipmentName} (ID: {ShipmentID}) <br>
+    <strong style="color:black;">Customer:</strong> {CustomerName} <br>
+    <strong style="color:black;">Parcel:</strong> {ParcelName} <br>
+    <strong style="color:black;">Status:</strong> {status_html} <br>
+    <strong style="color:black;">Location:</strong> {CurrentLocation}
+</div>
+"""
+
+@st.cache_resource
+def get_api_session():
+    # One pooled keep-alive session per process so reruns reuse connections;
+    # transient gateway errors are retried with a short backoff
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+    session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+    return session
+
+def _request_json(endpoint, params):
+    response = get_api_session().get(f"{API_BASE_URL}/{endpoint}", params=params, timeout=10)
+    response.raise_for_status()
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Keep bad payloads on the RequestException path fetch_data reports
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+# Cached GETs, one TTL tier per function; params are passed as a sorted tuple
+# of items so the cache key is stable
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_get_short(endpoint, params_key):
+    return _request_json(endpoint, dict(params_key))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get(endpoint, params_key):
+    return _request_json(endpoint, dict(params_key))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_get_long(endpoint, params_key):
+    return _request_json(endpoint, dict(params_key))
+
+SHORT_TTL_ENDPOINTS = ("shipments", "dashboard/summary")
+LONG_TTL_ENDPOINTS = ("customers", "personnel")
+
+def _get_json(endpoint, params=None):
+    params_key = tuple(sorted((params or {}).items()))
+    if endpoint in SHORT_TTL_ENDPOINTS:
+        return _cached_get_short(endpoint, params_key)
+    if endpoint in LONG_TTL_ENDPOINTS:
+        return _cached_get_long(endpoint, params_key)
+    return _cached_get(endpoint, params_key)
+
+def _clear_api_cache():
+    _cached_get_short.clear()
+    _cached_get.clear()
+    _cached_get_long.clear()
 
 def fetch_data(endpoint, params=None):
     try:
-        response = requests.get(f"{API_BASE_URL}/{endpoint}", params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(endpoint, params)
     except requests.exceptions.RequestException as e:
         st.error(f"Error fetching data from {endpoint}: {str(e)}")
         return None
 
+def fetch_many(specs):
+    # Issue independent GETs concurrently; results come back in spec order, so
+    # the same endpoint can be requested with different params. Errors are
+    # reported from the script thread
+    results = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [(endpoint, executor.submit(_get_json, endpoint, params)) for endpoint, params in specs]
+        for endpoint, future in futures:
+            try:
+                results.append(future.result())
+            except requests.exceptions.RequestException as e:
+                st.error(f"Error fetching data from {endpoint}: {str(e)}")
+                results.append(None)
+    return results
+
 def update_data(endpoint, data):
     try:
-        response = requests.put(f"{API_BASE_URL}/{endpoint}", json=data, timeout=10)
+        response = get_api_session().put(f"{API_BASE_URL}/{endpoint}", json=data, timeout=10)
         response.raise_for_status()
+        _clear_api_cache()
         return response.json()
     except requests.exceptions.RequestException as e:
         st.error(f"Error updating data at {endpoint}: {str(e)}")
@@ -106,13 +275,328 @@ def update_data(endpoint, data):
 
 def create_data(endpoint, data):
     try:
-        response = requests.post(f"{API_BASE_URL}/{endpoint}", json=data, timeout=10)
+        response = get_api_session().post(f"{API_BASE_URL}/{endpoint}", json=data, timeout=10)
         response.raise_for_status()
+        _clear_api_cache()
         return response.json()
     except requests.exceptions.RequestException as e:
         st.error(f"Error creating data at {endpoint}: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False)
+def picker_options(records, name_key, id_key):
+    # Selectbox labels plus a label -> ID lookup, so selections are never re-parsed
+    label_to_id = {f"{r[name_key]} (ID: {r[id_key]})": r[id_key] for r in records}
+    return list(label_to_id), label_to_id
+
+@st.cache_data(show_spinner=False)
+def customer_picker_options(customers):
+    # Filter options are the customer IDs, labelled through format_func, so the
+    # widget state holds the ID and can be read before the list is fetched
+    labels = {c['CustomerID']: f"{c['Name']} (ID: {c['CustomerID']})" for c in customers}
+    return ["All", *labels], labels
+
+@st.cache_data(show_spinner=False)
+def customer_type_options(types):
+    # Sorted so the options, and the selectbox state, are stable across reruns
+    return ["All"] + types.drop_duplicates().sort_values().tolist()
+
+def fallback_location(location):
+    # crc32 rather than hash() so the same unknown location maps to the same
+    # city in every process, so its marker doesn't jump between reruns
+    index = zlib.crc32(str(location).encode("utf-8")) % len(LOCATION_KEYS)
+    return LOCATIONS[LOCATION_KEYS[index]]
+
+def build_shipment_map(map_df):
+    # Not cached: st.plotly_chart re-validates a cached figure, which costs
+    # more than building these few traces again
+    fig = go.Figure()
+    
+    # One trace per status keeps the colored legend; unmapped statuses are gray
+    for status, group in map_df.groupby('Status', sort=False):
+        fig.add_trace(go.Scattermapbox(
+            lat=group['lat'].to_numpy(),
+            lon=group['lon'].to_numpy(),
+            mode='markers',
+            name=status,
+            marker=dict(size=15, color=COLOR_MAPPING.get(status, 'gray')),
+            text=group['ShipmentName'].to_numpy(),
+            customdata=group[['ShipmentID', 'Location']].to_numpy(),
+            hovertemplate=(
+                "<b>%{text}</b><br>ShipmentID=%{customdata[0]}<br>"
+                f"Status={status}<br>Location=%{{customdata[1]}}<extra></extra>"
+            )
+        ))
+    
+    fig.update_layout(
+        mapbox=dict(
+            style="carto-positron",
+            zoom=3,
+            center=dict(lat=map_df['lat'].mean(), lon=map_df['lon'].mean())
+        ),
+        legend_title_text='Status',
+        height=500,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_trend_df(base_efficiency, base_rating, base_ontime, today):
+    # Mock 30 day KPI trends, seeded from the inputs so reruns show the same series
+    rng = np.random.default_rng(zlib.crc32(repr((base_efficiency, base_rating, base_ontime, today)).encode("utf-8")))
+    days = 30
+    
+    return pd.DataFrame({
+        'Date': [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days, 0, -1)],
+        'Efficiency': np.clip(base_efficiency + rng.normal(0, 5, size=days), 50, 100),
+        'Customer Rating': np.clip(base_rating + rng.normal(0, 0.3, size=days), 1, 5),
+        'On-Time Percentage': np.clip(base_ontime + rng.normal(0, 3, size=days), 70, 100)
+    })
+
+# px.pie is slow to construct, so the pie is cached as figure JSON; the
+# graph_objects gauge is cheaper to rebuild than to restore from a cache
+@st.cache_data(show_spinner=False)
+def build_status_pie(status_data):
+    fig = px.pie(
+        names=list(status_data.keys()),
+        values=list(status_data.values()),
+        color_discrete_sequence=px.colors.sequential.RdBu,
+        hole=0.4
+    )
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=30, b=20),
+        height=300,
+        legend_title_text='Status'
+    )
+    return pio.to_json(fig)
+
+def build_efficiency_gauge(efficiency):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=efficiency,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Efficiency Score"},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1},
+            'bar': {'color': "red"},
+            'steps': [
+                {'range': [0, 33], 'color': "lightgray"},
+                {'range': [33, 66], 'color': "gray"},
+                {'range': [66, 100], 'color': "darkgray"}
+            ],
+            'threshold': {
+                'line': {'color': "green", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
+    return fig
+
+def lttb_indices(y, n_out):
+    # Largest-Triangle-Three-Buckets over evenly spaced x; returns the row
+    # positions to keep, always including the first and last point
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+@st.cache_data(show_spinner=False)
+def trend_series(trend_df, column):
+    # One KPI series indexed by date for st.line_chart; long series are
+    # downsampled so the browser only gets what it can draw
+    if len(trend_df) > MAX_TREND_POINTS:
+        trend_df = trend_df.iloc[lttb_indices(trend_df[column].to_numpy(), MAX_TREND_POINTS)]
+    return trend_df.set_index(pd.to_datetime(trend_df['Date']))[[column]]
+
+def metric_row_html(metrics):
+    # A row of (label, value) metric cards as a single flex block, so the row
+    # is one st.markdown call instead of one per card; cards wrap onto new
+    # lines on narrow screens like st.columns would stack
+    cards = "".join(
+        f'<div class="card" style="flex:1;min-width:10rem;">'
+        f'<div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div>'
+        f'</div>'
+        for label, value in metrics
+    )
+    return f"<div style='display:flex;flex-wrap:wrap;gap:1rem;'>{cards}</div>"
+
+def build_dashboard_html(dashboard_data):
+    # Metric card and recent shipment HTML for the Dashboard page
+    metrics = [
+        ("Total Customers", dashboard_data.get('total_customers', 0)),
+        ("Total Parcels", dashboard_data.get('total_parcels', 0)),
+        ("Total Shipments", dashboard_data.get('total_shipments', 0)),
+        ("On-Time Delivery", f"{dashboard_data.get('on_time_percentage', 0):.1f}%")
+    ]
+    metric_html = metric_row_html(metrics)
+    
+    recent_html = "".join(
+        RECENT_SHIPMENT_CARD.format(**shipment, status_html=format_status(shipment['Status']))
+        for shipment in dashboard_data.get('recent_shipments', [])
+    )
+    return metric_html, recent_html
+
+@st.cache_data(show_spinner=False)
+def records_to_df(records, columns=None, dtypes=None):
+    # DataFrame for a list of API records, reused across reruns while unchanged;
+    # fixed columns and dtypes skip pandas' per-row inference
+    df = pd.DataFrame.from_records(records, columns=columns)
+    if dtypes:
+        try:
+            df = df.astype(dtypes)
+        except (TypeError, ValueError):
+            # Values that don't fit the dtypes keep pandas' inferred columns
+            pass
+    return df
+
+@st.cache_data(show_spinner=False)
+def compute_layout(node_count, edges, iterations=50):
+    # Fruchterman-Reingold layout in vectorized numpy, cached per topology so
+    # a graph without coordinates is only laid out once
+    rng = np.random.default_rng(0)
+    pos = rng.random((node_count, 2))
+    k = np.sqrt(1.0 / max(node_count, 1))
+    step = 0.1
+    
+    for _ in range(iterations):
+        # Repulsion between every pair of nodes, k^2 / d
+        delta = pos[:, None, :] - pos[None, :, :]
+        dist = np.maximum(np.linalg.norm(delta, axis=-1), 0.01)
+        disp = (delta * (k * k / dist ** 2)[:, :, None]).sum(axis=1)
+        
+        # Attraction along edges, d^2 / k
+        diff = pos[edges[:, 0]] - pos[edges[:, 1]]
+        pull = diff * (np.linalg.norm(diff, axis=1) / k)[:, None]
+        np.subtract.at(disp, edges[:, 0], pull)
+        np.add.at(disp, edges[:, 1], pull)
+        
+        # Move each node by at most the current step, cooling as we go
+        length = np.maximum(np.linalg.norm(disp, axis=1), 0.01)
+        pos += disp * (np.minimum(length, step) / length)[:, None]
+        step -= 0.1 / (iterations + 1)
+    return pos
+
+@st.cache_data(show_spinner=False)
+def build_graph(hubs, routes):
+    # Graph assembly and trace coordinates for the Network page, rebuilt only
+    # when the hubs or routes change
+    # Hubs become rows of hubs_arr (one (x, y, size) per hub) and routes become
+    # rows of E (one hub index pair per route), built in bulk instead of node by node
+    names = [hub['name'] for hub in hubs]
+    index = {name: i for i, name in enumerate(names)}
+    hubs_arr = np.asarray(
+        [(hub.get('lon'), hub.get('lat'), hub['size']) for hub in hubs], dtype=np.float64
+    ).reshape(-1, 3)
+    E = np.asarray(
+        [(index[route['origin']], index[route['destination']]) for route in routes], dtype=np.intp
+    ).reshape(-1, 2)
+    
+    # Routes are undirected; drop reversed and repeated pairs
+    E = np.unique(np.sort(E, axis=1), axis=0)
+    
+    # Fall back to a computed layout only when no hub has coordinates, so known
+    # geographic positions are never replaced by layout points
+    if np.isnan(hubs_arr[:, :2]).all():
+        hubs_arr[:, :2] = compute_layout(len(hubs), E)
+    P = hubs_arr[:, :2]
+    
+    # NaN breaks the line between consecutive edges
+    edge_x = np.empty(len(E) * 3)
+    edge_x[0::3] = P[E[:, 0], 0]
+    edge_x[1::3] = P[E[:, 1], 0]
+    edge_x[2::3] = np.nan
+    
+    edge_y = np.empty(len(E) * 3)
+    edge_y[0::3] = P[E[:, 0], 1]
+    edge_y[1::3] = P[E[:, 1], 1]
+    edge_y[2::3] = np.nan
+    
+    node_x, node_y, sizes = hubs_arr.T
+    node_text = names
+    node_size = sizes * 10
+    
+    return edge_x, edge_y, node_x, node_y, node_text, node_size
+
+# Fragments rerun on their own, so interacting with them skips the rest of the page
+@st.fragment
+def render_trend_tabs(trend_df):
+    # Each series is cached on its own Date/value columns, so a change to one
+    # leaves the others cached
+    tab1, tab2, tab3 = st.tabs(["Efficiency", "Customer Satisfaction", "On-Time Delivery"])
+    
+    with tab1:
+        st.caption("Efficiency Score Trend")
+        st.line_chart(trend_series(trend_df[['Date', 'Efficiency']], 'Efficiency'), height=400)
+    
+    with tab2:
+        st.caption("Customer Satisfaction Trend")
+        st.line_chart(trend_series(trend_df[['Date', 'Customer Rating']], 'Customer Rating'), height=400)
+    
+    with tab3:
+        st.caption("On-Time Delivery Trend")
+        st.line_chart(trend_series(trend_df[['Date', 'On-Time Percentage']], 'On-Time Percentage'), height=400)
+
+@st.fragment
+def render_network_map(hubs, routes):
+    edge_x, edge_y, node_x, node_y, node_text, node_size = build_graph(hubs, routes)
+    
+    edge_trace = go.Scattergl(
+        x=edge_x, y=edge_y,
+        line=dict(width=0.5, color='#888'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    
+    node_trace = go.Scattergl(
+        x=node_x, y=node_y,
+        mode='markers',
+        hoverinfo='text',
+        text=node_text,
+        marker=dict(
+            showscale=True,
+            colorscale='YlOrRd',
+            size=node_size,
+            colorbar=dict(
+                thickness=15,
+                title='Hub Size',
+                xanchor='left',
+                titleside='right'
+            ),
+            line_width=2
+        )
+    )
+    
+    fig = go.Figure(data=[edge_trace, node_trace],
+                    layout=go.Layout(
+                        showlegend=False,
+                        hovermode='closest',
+                        margin=dict(b=20, l=5, r=5, t=40),
+                        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+                    ))
+    
+    fig.update_layout(height=600)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+
 # Sidebar navigation
  
 st.sidebar.markdown("<div class='main-header'>DHL Logistics</div>", unsafe_allow_html=True)
@@ -123,6 +607,10 @@ page = st.sidebar.radio(
     ["Dashboard", "Shipments", "Customers", "Parcels", "Analytics"]
 )
 
+# API responses are cached; this forces the next fetches to hit the API
+if st.sidebar.button("Refresh Data"):
+    _clear_api_cache()
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Filters")
 
@@ -140,48 +628,10 @@ if page == "Dashboard":
     # Get dashboard summary data
     dashboard_data = fetch_data("dashboard/summary")
     if dashboard_data:
+        metric_html, recent_html = build_dashboard_html(dashboard_data)
+        
         # Top metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Total Customers</div>
-                    <div class="metric-value">{dashboard_data.get('total_customers', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        with col2:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Total Parcels</div>
-                    <div class="metric-value">{dashboard_data.get('total_parcels', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        with col3:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Total Shipments</div>
-                    <div class="metric-value">{dashboard_data.get('total_shipments', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        with col4:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">On-Time Delivery</div>
-                    <div class="metric-value">{dashboard_data.get('on_time_percentage', 0):.1f}%</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        st.markdown(metric_html, unsafe_allow_html=True)
 
         # Charts row
         col1, col2 = st.columns(2)
@@ -191,18 +641,7 @@ if page == "Dashboard":
             
             status_data = dashboard_data.get('status_breakdown', {})
             if status_data:
-                fig = px.pie(
-                    names=list(status_data.keys()),
-                    values=list(status_data.values()),
-                    color_discrete_sequence=px.colors.sequential.RdBu,
-                    hole=0.4
-                )
-                fig.update_layout(
-                    margin=dict(l=20, r=20, t=30, b=20),
-                    height=300,
-                    legend_title_text='Status'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(pio.from_json(build_status_pie(status_data)), use_container_width=True, config=PLOTLY_CONFIG)
             else:
                 st.info("No status data available")
         
@@ -212,50 +651,13 @@ if page == "Dashboard":
             # Create a gauge chart for efficiency
             efficiency = dashboard_data.get('efficiency', 0)
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=efficiency,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Efficiency Score"},
-                gauge={
-                    'axis': {'range': [0, 100], 'tickwidth': 1},
-                    'bar': {'color': "red"},
-                    'steps': [
-                        {'range': [0, 33], 'color': "lightgray"},
-                        {'range': [33, 66], 'color': "gray"},
-                        {'range': [66, 100], 'color': "darkgray"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "green", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            fig.update_layout(height=300, margin=dict(l=20, r=20, t=30, b=20))
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_efficiency_gauge(efficiency), use_container_width=True, config=PLOTLY_CONFIG)
 
         # Recent shipments
         st.markdown('<div class="sub-header">Recent Shipments</div>', unsafe_allow_html=True)
-        recent_shipments = dashboard_data.get('recent_shipments', [])
         
-        if recent_shipments:
-            df = pd.DataFrame(recent_shipments)
-            for i, row in df.iterrows():
-                status_html = format_status(row['Status'])
-                
-                st.markdown(
-                    f"""
-                    <div class="card">
-                        <strong style="color:black;">Shipment:</strong><span style="color:navy; font-weight:bold;"> {row['ShipmentName']} (ID: {row['ShipmentID']}) <br>
-                        <strong style="color:black;">Customer:</strong> {row['CustomerName']} <br>
-                        <strong style="color:black;">Parcel:</strong> {row['ParcelName']} <br>
-                        <strong style="color:black;">Status:</strong> {status_html} <br>
-                        <strong style="color:black;">Location:</strong> {row['CurrentLocation']}
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+        if recent_html:
+            st.markdown(recent_html, unsafe_allow_html=True)
         else:
             st.info("No recent shipments to display")
 
@@ -275,38 +677,50 @@ elif page == "Customers":
             with filter_col1:
                 filter_name = st.text_input("Filter by Name")
             with filter_col2:
-                customer_types = list(set(df['Type']))
-                filter_type = st.selectbox("Filter by Type", ["All"] + customer_types)
+                filter_type = st.selectbox("Filter by Type", customer_type_options(df['Type']))
             
-            filtered_df = df.copy()
+            # Combine the filters into one mask and index once
+            mask = pd.Series(True, index=df.index)
             if filter_name:
-                filtered_df = filtered_df[filtered_df['Name'].str.contains(filter_name, case=False)]
+                mask &= df['Name'].str.contains(filter_name, case=False, regex=False, na=False)
             if filter_type != "All":
-                filtered_df = filtered_df[filtered_df['Type'] == filter_type]
+                mask &= df['Type'].eq(filter_type)
+            filtered_df = df[mask]
             
             if not filtered_df.empty:
-                # Display as cards
-                for i, row in filtered_df.iterrows():
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(
-                            f"""
-                            <div class="card">
-                                <strong>{row['Name']}</strong> <span style="color:navy; font-weight:bold;">(ID: {row['CustomerID']})
-                                <br>Type: <span class="highlight">{row['Type']}</span>
-                                <br>Email: {row['Email']}
-                                <br>Phone: {row['Phone']}
-                                <br>Address: {row['Address']}
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                    with col2:
-                        if st.button(f"View Details #{row['CustomerID']}", key=f"view_{row['CustomerID']}"):
-                            customer_details = fetch_data(f"customers/{row['CustomerID']}")
-                            if customer_details:
-                                st.session_state.customer_filter = row['CustomerID']
-                                st.rerun()
+                # A single selectable table replaces the per-row "View Details" buttons
+                event = st.dataframe(
+                    filtered_df[['CustomerID', 'Name', 'Type', 'Email', 'Phone', 'Address']],
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config=CUSTOMER_COLUMN_CONFIG,
+                    key="customer_table",
+                    on_select="rerun",
+                    selection_mode="single-row"
+                )
+                
+                # Detail card for the selected customer only
+                selected_rows = event.selection.rows
+                if selected_rows and selected_rows[0] < len(filtered_df):
+                    customer_id = int(filtered_df['CustomerID'].iloc[selected_rows[0]])
+                    customer_details = fetch_data(f"customers/{customer_id}")
+                    if customer_details:
+                        st.session_state.customer_filter = customer_id
+                        with st.expander("Customer Details", expanded=True):
+                            st.markdown(
+                                f"""
+                                <div class="card">
+                                    <strong>{customer_details['Name']}</strong> <span style="color:navy; font-weight:bold;">(ID: {customer_details['CustomerID']})
+                                    <br>Type: <span class="highlight">{customer_details['Type']}</span>
+                                    <br>Email: {customer_details['Email']}
+                                    <br>Phone: {customer_details['Phone']}
+                                    <br>Address: {customer_details['Address']}
+                                </div>
+                                """,
+                                unsafe_allow_html=True
+                            )
+                else:
+                    st.caption("Select a row to view customer details")
             else:
                 st.info("No customers found with the selected filters")
         else:
@@ -343,18 +757,26 @@ elif page == "Customers":
 elif page == "Parcels":
     st.markdown('<div class="main-header">Parcel Management</div>', unsafe_allow_html=True)
     
-    # Get parcels data
-    parcels = fetch_data("parcels", {"limit": 100})
+    # Get parcels and customers data; the customer selection is read from the
+    # widget state so the filtered parcels go out with the customer list
+    # instead of in a second request
+    params = {"limit": 100}
+    
+    customer_id = st.session_state.get("parcels_customer_filter", "All")
+    if customer_id != "All":
+        params["customer_id"] = customer_id
+    
+    parcels, customers = fetch_many([("parcels", params), ("customers", {"limit": 100})])
     
     # Customer filter
-    customers = fetch_data("customers", {"limit": 100})
     if customers:
-        customer_options = ["All"] + [f"{c['Name']} (ID: {c['CustomerID']})" for c in customers]
-        selected_customer = st.selectbox("Filter by Customer", customer_options)
-        
-        if selected_customer != "All":
-            customer_id = int(selected_customer.split("ID: ")[1].strip(")"))
-            parcels = fetch_data("parcels", {"customer_id": customer_id, "limit": 100})
+        customer_options, customer_labels = customer_picker_options(customers)
+        st.selectbox(
+            "Filter by Customer",
+            customer_options,
+            format_func=lambda option: customer_labels.get(option, option),
+            key="parcels_customer_filter"
+        )
     
     if parcels:
         df = pd.DataFrame(parcels)
@@ -364,14 +786,7 @@ elif page == "Parcels":
         st.dataframe(
             df[['ParcelID', 'ParcelName', 'CustomerID', 'Weight', 'Type', 'ShippingMethod']],
             use_container_width=True,
-            column_config={
-                "ParcelID": "ID",
-                "ParcelName": "Name",
-                "CustomerID": "Customer ID",
-                "Weight": st.column_config.NumberColumn("Weight (kg)", format="%.2f"),
-                "Type": "Type",
-                "ShippingMethod": "Shipping Method"
-            }
+            column_config=PARCEL_COLUMN_CONFIG
         )
         
         # Detailed view for selected parcel
@@ -403,22 +818,22 @@ elif page == "Parcels":
                         if parcel_shipments:
                             st.markdown("### Associated Shipments")
                             shipment_df = pd.DataFrame(parcel_shipments)
+                            shipment_df['StatusHTML'] = shipment_df['Status'].map(format_status)
                             
-                            for i, row in shipment_df.iterrows():
-                                status_html = format_status(row['Status'])
-                                
-                                st.markdown(
+                            html_parts = []
+                            for row in shipment_df.itertuples(index=False):
+                                html_parts.append(
                                     f"""
                                     <div class="card">
-                                        <strong>Shipment:</strong> {row['ShipmentName']} (ID: {row['ShipmentID']}) <br>
-                                        <strong>Status:</strong> {status_html} <br>
-                                        <strong>Current Location:</strong> {row['CurrentLocation']} <br>
-                                        <strong>Shipping Date:</strong> {row['ShipmentDate']} <br>
-                                        <strong>Delivery Date:</strong> {row['DeliveryDate']}
+                                        <strong>Shipment:</strong> {row.ShipmentName} (ID: {row.ShipmentID}) <br>
+                                        <strong>Status:</strong> {row.StatusHTML} <br>
+                                        <strong>Current Location:</strong> {row.CurrentLocation} <br>
+                                        <strong>Shipping Date:</strong> {row.ShipmentDate} <br>
+                                        <strong>Delivery Date:</strong> {row.DeliveryDate}
                                     </div>
-                                    """,
-                                    unsafe_allow_html=True
+                                    """
                                 )
+                            st.markdown("".join(html_parts), unsafe_allow_html=True)
                         else:
                             st.info("No shipments found for this parcel")
     else:
@@ -435,24 +850,29 @@ elif page == "Shipments":
         status_options = ["All", "Processing", "In Transit", "Delivered", "Delayed"]
         selected_status = st.selectbox("Filter by Status", status_options)
     
-    with col2:
-        # Customer filter
-        customers = fetch_data("customers", {"limit": 100})
-        if customers:
-            customer_options = ["All"] + [f"{c['Name']} (ID: {c['CustomerID']})" for c in customers]
-            selected_customer = st.selectbox("Filter by Customer", customer_options)
-    
-    # Fetch shipments with filters
+    # Fetch shipments with filters; the customer selection is read from the
+    # widget state so both requests can go out together
     params = {"limit": 100}
     
     if selected_status != "All":
         params["status"] = selected_status
     
-    if selected_customer != "All":
-        customer_id = int(selected_customer.split("ID: ")[1].strip(")"))
+    customer_id = st.session_state.get("shipments_customer_filter", "All")
+    if customer_id != "All":
         params["customer_id"] = customer_id
     
-    shipments = fetch_data("shipments", params)
+    customers, shipments = fetch_many([("customers", {"limit": 100}), ("shipments", params)])
+    
+    with col2:
+        # Customer filter
+        if customers:
+            customer_options, customer_labels = customer_picker_options(customers)
+            st.selectbox(
+                "Filter by Customer",
+                customer_options,
+                format_func=lambda option: customer_labels.get(option, option),
+                key="shipments_customer_filter"
+            )
     
     if shipments:
         df = pd.DataFrame(shipments)
@@ -460,95 +880,47 @@ elif page == "Shipments":
         # Map visualization for shipment locations
         st.markdown('<div class="sub-header">Shipment Locations</div>', unsafe_allow_html=True)
         
-        # Mock location data (in a real application, you would get actual coordinates)
-        locations = {
-            "New York": [40.7128, -74.0060],
-            "Los Angeles": [34.0522, -118.2437],
-            "Chicago": [41.8781, -87.6298],
-            "Houston": [29.7604, -95.3698],
-            "Phoenix": [33.4484, -112.0740],
-            "Philadelphia": [39.9526, -75.1652],
-            "San Antonio": [29.4241, -98.4936],
-            "San Diego": [32.7157, -117.1611],
-            "Dallas": [32.7767, -96.7970],
-            "San Jose": [37.3382, -121.8863],
-            "Austin": [30.2672, -97.7431],
-            "Jacksonville": [30.3322, -81.6557],
-            "San Francisco": [37.7749, -122.4194],
-            "Columbus": [39.9612, -82.9988],
-            "Indianapolis": [39.7684, -86.1581],
-            "Seattle": [47.6062, -122.3321],
-            "Denver": [39.7392, -104.9903],
-            "Washington": [38.9072, -77.0369],
-            "Boston": [42.3601, -71.0589],
-            "Nashville": [36.1627, -86.7816]
-        }
-        
-        # If a location is not in our mock data, assign a random one
-        import random
-        map_data = []
-        
-        for i, row in df.iterrows():
-            location = row['CurrentLocation']
-            if location in locations:
-                lat, lon = locations[location]
-            else:
-                # Pick a random location
-                random_location = random.choice(list(locations.keys()))
-                lat, lon = locations[random_location]
-            
-            map_data.append({
-                'ShipmentID': row['ShipmentID'],
-                'ShipmentName': row['ShipmentName'],
-                'Status': row['Status'],
-                'Location': location,
-                'lat': lat,
-                'lon': lon
-            })
-        
-        map_df = pd.DataFrame(map_data)
-        
-        # Color mapping for status
-        color_mapping = {
-            'Processing': 'black',
-            'In Transit': 'orange',
-            'Delivered': 'green',
-            'Delayed': 'red'
-        }
-        
-        # Default color for status not in mapping
-        map_df['color'] = map_df['Status'].apply(lambda x: color_mapping.get(x, 'gray'))
-        
-        fig = px.scatter_mapbox(
-            map_df,
-            lat="lat",
-            lon="lon",
-            hover_name="ShipmentName",
-            hover_data=["ShipmentID", "Status", "Location"],
-            color="Status",
-            color_discrete_map=color_mapping,
-            zoom=3,
-            size=[15] * len(map_df),
-            mapbox_style="carto-positron"
+        # Resolve coordinates with a vectorized lookup
+        map_df = df[['ShipmentID', 'ShipmentName', 'Status', 'CurrentLocation']].rename(
+            columns={'CurrentLocation': 'Location'}
         )
+        map_df['lat'] = map_df['Location'].map(LOCATION_LAT)
+        map_df['lon'] = map_df['Location'].map(LOCATION_LON)
+        
+        # If a location is not in our mock data, assign a stable stand-in
+        unknown = map_df['lat'].isna()
+        if unknown.any():
+            map_df.loc[unknown, ['lat', 'lon']] = [
+                fallback_location(location) for location in map_df.loc[unknown, 'Location']
+            ]
         
-        fig.update_layout(height=500, margin=dict(l=0, r=0, t=0, b=0))
-        st.plotly_chart(fig, use_container_width=True)
+        fig = build_shipment_map(map_df)
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
         
         # Shipment list
         st.markdown('<div class="sub-header">Shipment List</div>', unsafe_allow_html=True)
         
-        for i, row in df.iterrows():
-            status_html = format_status(row['Status'])
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
+        # A single selectable table; the card is only built for the selected row
+        event = st.dataframe(
+            df[['ShipmentID', 'ShipmentName', 'Status', 'CurrentLocation', 'ShipmentDate', 'DeliveryDate']],
+            use_container_width=True,
+            hide_index=True,
+            column_config=SHIPMENT_COLUMN_CONFIG,
+            key="shipment_table",
+            on_select="rerun",
+            selection_mode="single-row"
+        )
+        
+        # Detail card for the selected shipment only
+        selected_rows = event.selection.rows
+        if selected_rows and selected_rows[0] < len(df):
+            row = df.iloc[selected_rows[0]]
+            with st.expander("Shipment Details", expanded=True):
                 st.markdown(
                     f"""
                     <div class="card">
                         <strong>Shipment:</strong> <span style="color:navy; font-weight:bold;">{row['ShipmentName']} (ID: {row['ShipmentID']}) <br>
-                        <strong>Status:</strong> {status_html} <br>
+                        <strong>Status:</strong> {format_status(row['Status'])} <br>
                         <strong>Current Location:</strong> {row['CurrentLocation']} <br>
                         <strong>Shipping Date:</strong> {row['ShipmentDate']} <br>
                         <strong>Delivery Date:</strong> {row['DeliveryDate']}
@@ -556,25 +928,37 @@ elif page == "Shipments":
                     """,
                     unsafe_allow_html=True
                 )
+        else:
+            st.caption("Select a row to view shipment details")
+        
+        # Status update form
+        st.markdown('<div class="sub-header">Update Shipment Status</div>', unsafe_allow_html=True)
+        
+        with st.form(key="update_status_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                shipment_options, shipment_ids = picker_options(
+                    df[['ShipmentName', 'ShipmentID']].to_dict('records'), 'ShipmentName', 'ShipmentID'
+                )
+                selected_shipment = st.selectbox("Shipment", shipment_options)
             
             with col2:
-                # Status update form
-                with st.form(key=f"update_form_{row['ShipmentID']}"):
-                    new_status = st.selectbox(
-                        "New Status",
-                        ["Processing", "In Transit", "Delivered", "Delayed"],
-                        key=f"status_{row['ShipmentID']}"
-                    )
-                    
-                    if st.form_submit_button("Update Status"):
-                        result = update_data(
-                            f"shipments/{row['ShipmentID']}/status",
-                            {"Status": new_status}
-                        )
-                        
-                        if result:
-                            st.success(f"Updated status to {new_status}")
-                            st.rerun()
+                new_status = st.selectbox(
+                    "New Status",
+                    ["Processing", "In Transit", "Delivered", "Delayed"]
+                )
+            
+            if st.form_submit_button("Update Status"):
+                shipment_id = shipment_ids[selected_shipment]
+                result = update_data(
+                    f"shipments/{shipment_id}/status",
+                    {"Status": new_status}
+                )
+                
+                if result:
+                    st.success(f"Updated status to {new_status}")
+                    st.rerun()
     else:
         st.error("Failed to load shipment data")
 
@@ -593,7 +977,8 @@ elif page == "Personnel":
     if role_filter != "All":
         params["role"] = role_filter
     
-    personnel = fetch_data("personnel", params)
+    # Shipments for the assignment dropdown are fetched alongside personnel
+    personnel, shipments = fetch_many([("personnel", params), ("shipments", {"limit": 100})])
     
     if personnel:
         df = pd.DataFrame(personnel)
@@ -629,20 +1014,19 @@ elif page == "Personnel":
             col1, col2 = st.columns(2)
             
             with col1:
-                # Get shipments for dropdown
-                shipments = fetch_data("shipments", {"limit": 100})
+                # Shipments for dropdown
                 if shipments:
-                    shipment_options = [f"{s['ShipmentName']} (ID: {s['ShipmentID']})" for s in shipments]
+                    shipment_options, shipment_ids = picker_options(shipments, 'ShipmentName', 'ShipmentID')
                     selected_shipment = st.selectbox("Select Shipment", shipment_options)
-                    shipment_id = int(selected_shipment.split("ID: ")[1].strip(")"))
+                    shipment_id = shipment_ids[selected_shipment]
                 else:
                     st.error("Could not load shipments")
                     shipment_id = None
             
             with col2:
-                personnel_options = [f"{p['Name']} (ID: {p['PersonnelID']})" for p in personnel]
+                personnel_options, personnel_ids = picker_options(personnel, 'Name', 'PersonnelID')
                 selected_personnel = st.selectbox("Select Personnel", personnel_options)
-                personnel_id = int(selected_personnel.split("ID: ")[1].strip(")"))
+                personnel_id = personnel_ids[selected_personnel]
             
             submit = st.form_submit_button("Assign to Shipment")
             
@@ -676,110 +1060,36 @@ elif page == "Analytics":
     st.markdown('<div class="main-header">Analytics & KPIs</div>', unsafe_allow_html=True)
     
     # Fetch analytics data
-    kpi_data = fetch_data("analytics/kpi")
-    analytics_data = fetch_data("analytics", {"limit": 100})
-    customer_insights = fetch_data("dashboard/customer-insights")
+    kpi_data, analytics_data, customer_insights = fetch_many([
+        ("analytics/kpi", None),
+        ("analytics", {"limit": 100}),
+        ("dashboard/customer-insights", None)
+    ])
     
     if kpi_data and analytics_data and customer_insights:
         # KPI Metrics
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Average Efficiency</div>
-                    <div class="metric-value">{kpi_data.get('avg_efficiency', 0):.1f}%</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col2:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Customer Satisfaction</div>
-                    <div class="metric-value">{kpi_data.get('avg_customer_rating', 0):.1f}/5</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col3:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">On-Time Delivery</div>
-                    <div class="metric-value">{kpi_data.get('on_time_percentage', 0):.1f}%</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        st.markdown(
+            metric_row_html([
+                ("Average Efficiency", f"{kpi_data.get('avg_efficiency', 0):.1f}%"),
+                ("Customer Satisfaction", f"{kpi_data.get('avg_customer_rating', 0):.1f}/5"),
+                ("On-Time Delivery", f"{kpi_data.get('on_time_percentage', 0):.1f}%")
+            ]),
+            unsafe_allow_html=True
+        )
         
         # KPI Trends (mock data)
         st.markdown('<div class="sub-header">KPI Trends (Last 30 Days)</div>', unsafe_allow_html=True)
         
         # Create mock trend data
-        import numpy as np
-        
-        dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(30, 0, -1)]
-        
-        # Efficiency trend (with some randomness)
-        base_efficiency = kpi_data.get('avg_efficiency', 75)
-        efficiency_data = [max(min(base_efficiency + np.random.normal(0, 5), 100), 50) for _ in range(30)]
-        
-        # Customer rating trend
-        base_rating = kpi_data.get('avg_customer_rating', 4)
-        rating_data = [max(min(base_rating + np.random.normal(0, 0.3), 5), 1) for _ in range(30)]
-        
-        # On-time trend
-        base_ontime = kpi_data.get('on_time_percentage', 85)
-        ontime_data = [max(min(base_ontime + np.random.normal(0, 3), 100), 70) for _ in range(30)]
-        
-        # Create trend dataframe
-        trend_df = pd.DataFrame({
-            'Date': dates,
-            'Efficiency': efficiency_data,
-            'Customer Rating': rating_data,
-            'On-Time Percentage': ontime_data
-        })
+        trend_df = build_trend_df(
+            kpi_data.get('avg_efficiency', 75),
+            kpi_data.get('avg_customer_rating', 4),
+            kpi_data.get('on_time_percentage', 85),
+            datetime.now().date()
+        )
         
         # Plot trends
-        tab1, tab2, tab3 = st.tabs(["Efficiency", "Customer Satisfaction", "On-Time Delivery"])
-        
-        with tab1:
-            fig = px.line(
-                trend_df, 
-                x='Date', 
-                y='Efficiency',
-                title='Efficiency Score Trend',
-                markers=True
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with tab2:
-            fig = px.line(
-                trend_df, 
-                x='Date', 
-                y='Customer Rating',
-                title='Customer Satisfaction Trend',
-                markers=True
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with tab3:
-            fig = px.line(
-                trend_df, 
-                x='Date', 
-                y='On-Time Percentage',
-                title='On-Time Delivery Trend',
-                markers=True
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+        render_trend_tabs(trend_df)
         
         # Customer Insights
         st.markdown('<div class="sub-header">Customer Insights</div>', unsafe_allow_html=True)
@@ -787,14 +1097,8 @@ elif page == "Analytics":
         # Create customer distribution chart
         if 'customer_distribution' in customer_insights:
             customer_dist = customer_insights['customer_distribution']
-            fig = px.bar(
-                x=list(customer_dist.keys()),
-                y=list(customer_dist.values()),
-                title='Customer Type Distribution',
-                labels={'x': 'Customer Type', 'y': 'Count'}
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.caption("Customer Type Distribution")
+            st.bar_chart(pd.Series(customer_dist), x_label="Customer Type", y_label="Count", height=400)
         
         # Shipping volume by method
         if 'shipping_methods' in analytics_data:
@@ -806,7 +1110,7 @@ elif page == "Analytics":
                 hole=0.4
             )
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
     else:
         st.error("Failed to load analytics data")
 
@@ -821,153 +1125,41 @@ elif page == "Network Visualization":
         # Display network information
         st.markdown('<div class="sub-header">Network Overview</div>', unsafe_allow_html=True)
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Total Hubs</div>
-                    <div class="metric-value">{network_data.get('total_hubs', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col2:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Active Routes</div>
-                    <div class="metric-value">{network_data.get('active_routes', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col3:
-            st.markdown(
-                f"""
-                <div class="card">
-                    <div class="metric-label">Fleet Size</div>
-                    <div class="metric-value">{network_data.get('fleet_size', 0)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        st.markdown(
+            metric_row_html([
+                ("Total Hubs", network_data.get('total_hubs', 0)),
+                ("Active Routes", network_data.get('active_routes', 0)),
+                ("Fleet Size", network_data.get('fleet_size', 0))
+            ]),
+            unsafe_allow_html=True
+        )
         
         # Network visualization
         st.markdown('<div class="sub-header">Network Map</div>', unsafe_allow_html=True)
         
         # Create a network graph (mock data)
         if 'hubs' in network_data and 'routes' in network_data:
-            import networkx as nx
-            
-            # Create a graph
-            G = nx.Graph()
-            
-            # Add nodes (hubs)
-            for hub in network_data['hubs']:
-                G.add_node(hub['name'], pos=(hub['lon'], hub['lat']), size=hub['size'])
-            
-            # Add edges (routes)
-            for route in network_data['routes']:
-                G.add_edge(route['origin'], route['destination'], weight=route['volume'])
-            
-            # Get positions
-            pos = nx.get_node_attributes(G, 'pos')
-            
-            # Create a Plotly figure
-            edge_x = []
-            edge_y = []
-            
-            for edge in G.edges():
-                x0, y0 = pos[edge[0]]
-                x1, y1 = pos[edge[1]]
-                edge_x.extend([x0, x1, None])
-                edge_y.extend([y0, y1, None])
-            
-            edge_trace = go.Scatter(
-                x=edge_x, y=edge_y,
-                line=dict(width=0.5, color='#888'),
-                hoverinfo='none',
-                mode='lines'
-            )
-            
-            node_x = []
-            node_y = []
-            node_text = []
-            node_size = []
-            
-            for node in G.nodes():
-                x, y = pos[node]
-                node_x.append(x)
-                node_y.append(y)
-                node_text.append(node)
-                node_size.append(G.nodes[node]['size'] * 10)
-            
-            node_trace = go.Scatter(
-                x=node_x, y=node_y,
-                mode='markers',
-                hoverinfo='text',
-                text=node_text,
-                marker=dict(
-                    showscale=True,
-                    colorscale='YlOrRd',
-                    size=node_size,
-                    colorbar=dict(
-                        thickness=15,
-                        title='Hub Size',
-                        xanchor='left',
-                        titleside='right'
-                    ),
-                    line_width=2
-                )
-            )
-            
-            fig = go.Figure(data=[edge_trace, node_trace],
-                            layout=go.Layout(
-                                showlegend=False,
-                                hovermode='closest',
-                                margin=dict(b=20, l=5, r=5, t=40),
-                                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
-                            ))
-            
-            fig.update_layout(height=600)
-            st.plotly_chart(fig, use_container_width=True)
+            render_network_map(network_data['hubs'], network_data['routes'])
             
             # List of hubs
             st.markdown('<div class="sub-header">Hub List</div>', unsafe_allow_html=True)
             
-            hub_df = pd.DataFrame(network_data['hubs'])
+            hub_df = records_to_df(network_data['hubs'], HUB_COLUMNS, HUB_DTYPES)
             st.dataframe(
                 hub_df,
                 use_container_width=True,
-                column_config={
-                    "name": "Hub Name",
-                    "type": "Hub Type",
-                    "size": st.column_config.NumberColumn("Hub Size", format="%d"),
-                    "capacity": st.column_config.NumberColumn("Capacity", format="%d"),
-                    "utilization": st.column_config.ProgressColumn("Utilization", format="%d%%", min_value=0, max_value=100)
-                }
+                column_config=HUB_COLUMN_CONFIG
             )
             
             # Fleet information
             if 'fleet' in network_data:
                 st.markdown('<div class="sub-header">Fleet Information</div>', unsafe_allow_html=True)
                 
-                fleet_df = pd.DataFrame(network_data['fleet'])
+                fleet_df = records_to_df(network_data['fleet'], FLEET_COLUMNS, FLEET_DTYPES)
                 st.dataframe(
                     fleet_df,
                     use_container_width=True,
-                    column_config={
-                        "vehicle_id": "Vehicle ID",
-                        "type": "Vehicle Type",
-                        "capacity": st.column_config.NumberColumn("Capacity (kg)", format="%d"),
-                        "status": "Status",
-                        "location": "Current Location",
-                    }
+                    column_config=FLEET_COLUMN_CONFIG
                 )
         else:
             st.error("Incomplete network data")